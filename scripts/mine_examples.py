@@ -1,4 +1,6 @@
+import mmap
 import re
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from pathlib import Path
 from typing import Iterable, List, Optional, Dict, Any
@@ -57,36 +59,50 @@ SECTION_HEADERS = [
     "Results",
 ]
 
+# One alternation (longest-first so "Input files" wins over "Input file")
+# finds every section header in a single multiline pass over the text.
+# The hot-path patterns here are compiled as bytes patterns: files are
+# scanned as raw bytes and only the matched slices are decoded.
+_SECTION_HEADER_RE = re.compile(
+    rb"^[ \t]*(?P<name>"
+    + b"|".join(re.escape(h.encode("utf-8")) for h in sorted(SECTION_HEADERS, key=len, reverse=True))
+    + rb")[ \t\r]*$",
+    re.MULTILINE,
+)
+
+# The recognized-extension branches all share the same `[A-Za-z0-9_.\-/]+`
+# prefix, so we collapse them into a single run plus a suffix group. This
+# keeps the scan a single forward pass instead of retrying the same prefix
+# once per extension (the original alternation was a backtracking hazard on
+# long path-like tokens).
 FILE_PATH_RE = re.compile(
-    r"""
+    rb"""
     (?P<path>
         (?:\.\./)*inputFiles/[^\s`]+ |
         src/docs/sphinx/[^\s`]+     |
         GEOSDATA[^\s`]*             |
-        [A-Za-z0-9_.\-/]+\.xml      |
-        [A-Za-z0-9_.\-/]+\.py       |
-        [A-Za-z0-9_.\-/]+\.txt      |
-        [A-Za-z0-9_.\-/]+\.vtu      |
-        [A-Za-z0-9_.\-/]+\.vtk      |
-        [A-Za-z0-9_.\-/]+\.csv      |
-        [A-Za-z0-9_.\-/]+\.h5       |
-        [A-Za-z0-9_.\-/]+\.xdmf     |
-        [A-Za-z0-9_.\-/]+\.xmf
+        [A-Za-z0-9_.\-/]+\.(?:xml|py|txt|vtu|vtk|csv|h5|xdmf|xmf)\b
     )
     """,
     re.VERBOSE,
 )
 
+# Only the command *head* is matched here; the short literal heads are
+# unambiguous (no branch overlaps the `[ \t]` runs around it), so the scan
+# cannot backtrack meaningfully on a malformed line. The old
+# "[^\n]*geosx[^\n]*"-style tails were ambiguous and could go quadratic;
+# those containment requirements are now plain substring checks in
+# _extract_run_commands.
 RUN_CMD_RE = re.compile(
-    r"""
-    ^\s*
+    rb"""
+    ^[\ \t]*
     (?:
-        (?:mpirun|mpiexec)[^\n]*geosx[^\n]* |
-        (?:\$\s*)?(?:\S*/)?geosx[^\n]*-i[^\n]* |
-        python\s+[^\n]*\.py[^\n]*
+        (?P<mpi>mpirun|mpiexec) |
+        (?P<geosx>(?:\$[\ \t]*)?(?:[^\s/]*/)*geosx) |
+        (?P<python>python[\ \t]+)
     )
     """,
-    re.IGNORECASE | re.VERBOSE,
+    re.IGNORECASE | re.MULTILINE | re.VERBOSE,
 )
 
 # Very loose heuristic: expected outputs are files mentioned
@@ -94,79 +110,110 @@ RUN_CMD_RE = re.compile(
 OUTPUT_SECTION_HINTS = {"inspecting results", "results"}
 
 
-def _read_text(path: Path) -> List[str]:
-    text = path.read_text(encoding="utf-8")
-    return text.splitlines()
+_NONSPACE_RE = re.compile(rb"\S")
 
 
-def _find_section_indices(lines: List[str]) -> Dict[str, int]:
-    """
-    Return a map from header name (as in SECTION_HEADERS) to the
-    line index where that header appears.
+def _first_nonempty_line(buf) -> bytes:
+    """Return the first non-empty line of a bytes-like buffer, stripped."""
+    m = _NONSPACE_RE.search(buf)
+    if not m:
+        return b""
+    start = buf.rfind(b"\n", 0, m.start()) + 1
+    end = buf.find(b"\n", m.start())
+    if end == -1:
+        end = len(buf)
+    return bytes(buf[start:end]).strip()
 
-    We treat a line that matches the header *exactly* as the header.
+
+def _split_sections(text: bytes) -> tuple[Dict[str, int], Dict[str, bytes]]:
     """
-    indices: Dict[str, int] = {}
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped in SECTION_HEADERS and stripped not in indices:
-            indices[stripped] = i
-    return indices
+    Split the text at section headers in a single pass.
 
+    Returns (header_starts, section_bodies): the character offset of each
+    header's line, and the body text between that header and the next one
+    (or end of file), already stripped. Only the first occurrence of each
+    header counts, matching the old line-based behavior.
 
-def _slice_section(lines: List[str], start_idx: int, end_idx: Optional[int]) -> str:
-    if end_idx is None:
-        end = len(lines)
-    else:
-        end = end_idx
-    # Skip the header line itself
-    body = lines[start_idx + 1 : end]
-    return "\n".join(body).strip()
+    We treat a line that matches the header *exactly* as the header.
+    """
+    header_starts: Dict[str, int] = {}
+    entries: List[tuple[str, int]] = []  # (name, body start offset)
+    for m in _SECTION_HEADER_RE.finditer(text):
+        name = m.group("name").decode("utf-8")
+        if name not in header_starts:
+            header_starts[name] = m.start()
+            entries.append((name, m.end()))
+
+    section_bodies: Dict[str, bytes] = {}
+    for pos, (name, body_start) in enumerate(entries):
+        if pos + 1 < len(entries):
+            end = header_starts[entries[pos + 1][0]]
+        else:
+            end = len(text)
+        # Normalize CRLF on the kept slice only: read_text()'s universal
+        # newlines did this for the whole file, and the JSON ground truth
+        # shouldn't depend on the source file's line endings.
+        section_bodies[name] = text[body_start:end].replace(b"\r\n", b"\n").strip()
+    return header_starts, section_bodies
 
 
 def _extract_first_matching_section(
-    lines: List[str],
-    header_map: Dict[str, int],
+    section_bodies: Dict[str, bytes],
     names: List[str],
-    next_section_start: int | None,
-) -> str:
+) -> bytes:
     """
-    Return the concatenated body of the first section found among `names`.
+    Return the body of the first section found among `names`.
     """
     for name in names:
-        if name in header_map:
-            start_idx = header_map[name]
-            end_idx: Optional[int] = None
-            if next_section_start is not None and next_section_start > start_idx:
-                end_idx = next_section_start
-            return _slice_section(lines, start_idx, end_idx)
-    return ""
-
-
-def _extract_all_paths(text: str) -> List[str]:
-    paths = []
-    for m in FILE_PATH_RE.finditer(text):
-        paths.append(m.group("path"))
-    # Deduplicate while preserving order
+        if name in section_bodies:
+            return section_bodies[name]
+    return b""
+
+
+def _extract_all_paths(data: bytes) -> List[str]:
+    # Deduplicate in the same pass as the scan, preserving first-seen order;
+    # only unique matches are decoded.
     seen = set()
     unique = []
-    for p in paths:
+    for m in FILE_PATH_RE.finditer(data):
+        p = m.group("path")
         if p not in seen:
             seen.add(p)
-            unique.append(p)
+            unique.append(p.decode("utf-8"))
     return unique
 
 
-def _extract_run_commands(text: str) -> List[str]:
+def _extract_run_commands(data) -> List[str]:
+    """Extract run commands from a bytes-like buffer (bytes or mmap)."""
     cmds = []
-    for line in text.splitlines():
-        m = RUN_CMD_RE.match(line)
-        if m:
-            cmd = line.strip()
-            if cmd.startswith("$"):
-                cmd = cmd.lstrip("$").strip()
-            if cmd and cmd not in cmds:
-                cmds.append(cmd)
+    seen = set()
+    # The multiline head pattern yields at most one candidate per line, so
+    # the buffer is scanned in place without splitting it into lines.
+    for m in RUN_CMD_RE.finditer(data):
+        line_end = data.find(b"\n", m.end())
+        if line_end == -1:
+            line_end = len(data)
+        # The head regex is deliberately minimal; check the rest of the
+        # line with linear substring searches instead of unanchored
+        # regex tails.
+        rest = bytes(data[m.end() : line_end]).lower()
+        if m.lastgroup == "mpi":
+            if b"geosx" not in rest:
+                continue
+        elif m.lastgroup == "geosx":
+            if b"-i" not in rest:
+                continue
+        else:  # python
+            if b".py" not in rest:
+                continue
+        cmd = bytes(data[m.start() : line_end]).strip()
+        if cmd.startswith(b"$"):
+            cmd = cmd.lstrip(b"$").strip()
+        if cmd:
+            cmd_s = cmd.decode("utf-8")
+            if cmd_s not in seen:
+                seen.add(cmd_s)
+                cmds.append(cmd_s)
     return cmds
 
 
@@ -184,48 +231,59 @@ def parse_example_rst(
     This uses simple heuristics tailored to the GEOS docs; you can
     refine the regexes once you've inspected more examples.
     """
-    lines = _read_text(rst_path)
-    header_map = _find_section_indices(lines)
+    # Map the file instead of copying it onto the heap; the bytes regexes
+    # scan the mapped buffer directly and only result slices are copied out.
+    with open(rst_path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap cannot map empty files
+            mm = None
+        try:
+            return _parse_example_buffer(
+                mm if mm is not None else b"", rst_path, category, repo_root
+            )
+        finally:
+            if mm is not None:
+                mm.close()
+
+
+def _parse_example_buffer(
+    full_text,
+    rst_path: Path,
+    category: str,
+    repo_root: Path,
+) -> ExampleGroundTruth:
+    """Parse an in-memory (or mmap'd) RST buffer; see parse_example_rst."""
+    # Split into sections once; everything below works on these slices.
+    # Sections stay as bytes; only the few bodies we keep are decoded.
+    header_map, section_bodies = _split_sections(full_text)
 
     # Title: first non-empty line
-    title = ""
-    for line in lines:
-        if line.strip():
-            title = line.strip()
-            break
-
-    # To find section boundaries, we sort headers by line index.
-    header_items = sorted(header_map.items(), key=lambda kv: kv[1])
-    header_starts = [idx for _, idx in header_items]
-
-    def next_header_after(idx: int) -> Optional[int]:
-        for h in header_starts:
-            if h > idx:
-                return h
-        return None
+    title = _first_nonempty_line(full_text).decode("utf-8")
 
     # Context / Objectives section bodies
-    context = ""
-    if any(h in header_map for h in ("Context",)):
-        idx = min(header_map[h] for h in ("Context",) if h in header_map)
-        next_idx = next_header_after(idx)
-        context = _slice_section(lines, idx, next_idx)
+    context = section_bodies.get("Context", b"").decode("utf-8")
 
     objectives = ""
-    if any(h in header_map for h in ("Objective", "Objectives")):
-        idx = min(header_map[h] for h in ("Objective", "Objectives") if h in header_map)
-        next_idx = next_header_after(idx)
-        objectives = _slice_section(lines, idx, next_idx)
+    obj_names = [h for h in ("Objective", "Objectives") if h in header_map]
+    if obj_names:
+        objectives = section_bodies[min(obj_names, key=header_map.__getitem__)].decode("utf-8")
 
     # For description, just grab a bit more of the file (optional)
     description = ""
     if "Context" in header_map:
-        start = header_map["Context"]
-        # up to e.g. "Input file" if present
-        end = header_map.get("Input file", header_map.get("Input files"))
-        description = _slice_section(lines, start, end)
-
-    full_text = "\n".join(lines)
+        # Body of "Context" up to e.g. "Input file" if present.
+        nl = full_text.find(b"\n", header_map["Context"])
+        start = len(full_text) if nl == -1 else nl + 1
+        end = header_map.get("Input file", header_map.get("Input files", len(full_text)))
+        description = (
+            full_text[start:end].replace(b"\r\n", b"\n").strip().decode("utf-8")
+        )
+
+    # Scan the whole file for paths once; the fallback and the aux-file
+    # classification below both reuse this.
+    all_paths = _extract_all_paths(full_text)
 
     # Input files: prioritize paths near the "Input file(s)" section if present
     input_files: List[str] = []
@@ -233,39 +291,37 @@ def parse_example_rst(
 
     if "Input file" in header_map or "Input files" in header_map:
         header_name = "Input file" if "Input file" in header_map else "Input files"
-        idx = header_map[header_name]
-        next_idx = next_header_after(idx)
-        input_section_text = _slice_section(lines, idx, next_idx)
-        input_paths = _extract_all_paths(input_section_text)
-        input_files.extend(input_paths)
+        input_files.extend(_extract_all_paths(section_bodies[header_name]))
 
     # If we didn't find any, fall back to scanning entire file
     if not input_files:
-        input_files = _extract_all_paths(full_text)
+        input_files = list(all_paths)
 
     # Run commands: look for commands in "Running..." / "Inspecting results" first
     run_commands: List[str] = []
     postprocess_commands: List[str] = []
+    run_seen: set = set()
+    post_seen: set = set()
 
     for hname in header_map:
         lower = hname.lower()
-        idx = header_map[hname]
-        next_idx = next_header_after(idx)
-        sec_text = _slice_section(lines, idx, next_idx)
-
-        cmds = _extract_run_commands(sec_text)
         if "running" in lower:
-            for c in cmds:
-                if "geosx" in c and c not in run_commands:
+            for c in _extract_run_commands(section_bodies[hname]):
+                if "geosx" in c and c not in run_seen:
+                    run_seen.add(c)
                     run_commands.append(c)
-                elif c not in postprocess_commands:
+                elif c not in post_seen:
+                    post_seen.add(c)
                     postprocess_commands.append(c)
         elif "inspect" in lower or "results" in lower:
-            for c in cmds:
-                if "python" in c and c not in postprocess_commands:
+            for c in _extract_run_commands(section_bodies[hname]):
+                if "python" in c and c not in post_seen:
+                    post_seen.add(c)
                     postprocess_commands.append(c)
 
-    # Fallback: scan whole file for run commands
+    # Fallback: when the structured sections yielded nothing, scan the whole
+    # file — commands can sit outside the recognized sections. The buffer is
+    # scanned in place.
     if not run_commands and not postprocess_commands:
         cmds = _extract_run_commands(full_text)
         for c in cmds:
@@ -276,28 +332,23 @@ def parse_example_rst(
 
     # Expected outputs: from "Inspecting results" / "Results" sections
     expected_outputs: List[str] = []
-    for hname, idx in header_map.items():
+    output_seen: set = set()
+    for hname in header_map:
         if hname.lower() in OUTPUT_SECTION_HINTS:
-            next_idx = next_header_after(idx)
-            sec_text = _slice_section(lines, idx, next_idx)
-            paths = _extract_all_paths(sec_text)
-            for p in paths:
-                if p not in expected_outputs:
+            for p in _extract_all_paths(section_bodies[hname]):
+                if p not in output_seen:
+                    output_seen.add(p)
                     expected_outputs.append(p)
 
     # Aux files: everything that isn't clearly a primary input deck
     # (This is a heuristic; you can refine it later.)
-    primary_ext = {".xml"}
-    for p in _extract_all_paths(full_text):
-        suffix = Path(p).suffix
-        if (
-            suffix not in primary_ext
-            and p not in input_files
-            and p not in expected_outputs
-        ):
+    # Membership sets and a plain endswith test keep the loop free of
+    # per-item Path construction and list scans.
+    input_set = set(input_files)
+    output_set = set(expected_outputs)
+    for p in all_paths:
+        if not p.endswith(".xml") and p not in input_set and p not in output_set:
             aux_files.append(p)
-    # Dedup
-    aux_files = list(dict.fromkeys(aux_files))
 
     # Example ID: e.g. "basic/multiphaseFlow"
     # Use path naming convention:
@@ -355,20 +406,34 @@ def iter_example_rst_paths(
             yield path, "advanced"
 
 
-def load_all_examples(repo_root: Path) -> List[ExampleGroundTruth]:
+def _parse_one(task: tuple[Path, str, Path]) -> Optional[ExampleGroundTruth]:
+    """Worker for load_all_examples; returns None on parse failure."""
+    rst_path, category, repo_root = task
+    try:
+        return parse_example_rst(rst_path, category=category, repo_root=repo_root)
+    except Exception as e:
+        # You can decide whether to raise or just log a warning.
+        # For now, we just print and skip.
+        print(f"[warn] Failed to parse {rst_path}: {e}")
+        return None
+
+
+def load_all_examples(
+    repo_root: Path,
+    max_workers: Optional[int] = None,
+) -> List[ExampleGroundTruth]:
     """
     Discover and parse all GEOS example docs into structured ground truth.
+
+    Parsing is CPU-bound regex scanning, so files are fanned out over a
+    process pool; results come back in discovery order.
     """
-    examples: List[ExampleGroundTruth] = []
-    for rst_path, category in iter_example_rst_paths(repo_root):
-        try:
-            ex = parse_example_rst(rst_path, category=category, repo_root=repo_root)
-            examples.append(ex)
-        except Exception as e:
-            # You can decide whether to raise or just log a warning.
-            # For now, we just print and skip.
-            print(f"[warn] Failed to parse {rst_path}: {e}")
-    return examples
+    tasks = [(p, category, repo_root) for p, category in iter_example_rst_paths(repo_root)]
+    if len(tasks) <= 1:
+        results = map(_parse_one, tasks)
+        return [ex for ex in results if ex is not None]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return [ex for ex in pool.map(_parse_one, tasks) if ex is not None]
 
 
 def dump_examples_to_json(
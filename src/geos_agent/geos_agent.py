@@ -1,7 +1,13 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json works fine without it
+    orjson = None
+
 from openai import OpenAI
 
 from geos_agent.agent_config import AgentConfig
@@ -11,6 +17,12 @@ from geos_agent.tools.base import Tool
 # Agent implementation
 # ==============================
 
+# Shared pool for dispatching the tool calls of one model turn concurrently.
+# The heavy tools (run_shell, run_python_code) block on subprocess I/O, so
+# threads are the right pool type; a process pool would just add a second
+# layer of spawns on top of the subprocesses the tools already create.
+_TOOL_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tool-call")
+
 
 class GeosAgent:
     """
@@ -47,7 +59,11 @@ class GeosAgent:
         self.messages: List[Dict[str, Any]] = []
         self.tools = tools
         self.tool_map = {t.name: t for t in tools}
+        # Tool specs never change after construction; build them once
+        # instead of on every model call.
+        self._tool_specs = [t.get_spec() for t in tools]
         self.log_path = log_path
+        self._log_file = None  # opened lazily on first event, kept open
 
     # ------------- logging -------------
 
@@ -56,16 +72,26 @@ class GeosAgent:
             return
         record = {"event": event, **kwargs}
         try:
-            with self.log_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            # Open once and let the file object's buffer batch events;
+            # _flush_log pushes them out at run boundaries.
+            if self._log_file is None:
+                self._log_file = self.log_path.open("a", encoding="utf-8")
+            self._log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
         except Exception:
             # Logging should never crash the agent
             pass
 
+    def _flush_log(self) -> None:
+        if self._log_file is not None:
+            try:
+                self._log_file.flush()
+            except Exception:
+                pass
+
     # ------------- tool plumbing -------------
 
     def _get_tool_specs(self) -> List[Dict[str, Any]]:
-        return [t.get_spec() for t in self.tools]
+        return self._tool_specs
 
     def _call_model(self) -> Any:
         """Call the OpenAI chat completion API with current messages."""
@@ -85,8 +111,13 @@ class GeosAgent:
         args_str = tool_call.function.arguments or "{}"
 
         try:
-            args = json.loads(args_str)
-        except json.JSONDecodeError as e:
+            # orjson parses the (possibly large) argument payloads in C;
+            # both parsers raise ValueError subclasses on bad input.
+            if orjson is not None:
+                args = orjson.loads(args_str)
+            else:
+                args = json.loads(args_str)
+        except ValueError as e:
             result = {"error": f"Failed to parse tool arguments: {e}", "raw": args_str}
             self._log("tool_args_parse_error", tool=name, error=str(e), raw=args_str)
             return json.dumps(result, ensure_ascii=False)
@@ -136,45 +167,57 @@ class GeosAgent:
 
             response = self._call_model()
             msg = response.choices[0].message
+            content = msg.content or ""
+            tool_calls = msg.tool_calls or []
 
             assistant_msg: Dict[str, Any] = {
                 "role": "assistant",
-                "content": msg.content or "",
+                "content": content,
             }
 
             # Attach tool_calls if present so the model sees them in history.
-            if msg.tool_calls:
-                assistant_msg["tool_calls"] = [
-                    {
-                        "id": tc.id,
-                        "type": "function",
-                        "function": {
-                            "name": tc.function.name,
-                            "arguments": tc.function.arguments,
-                        },
-                    }
-                    for tc in msg.tool_calls
-                ]
+            # One pass builds both the serialized calls and the name list for
+            # logging, instead of two comprehensions over the same data.
+            tool_names: List[str] = []
+            if tool_calls:
+                serialized_calls = []
+                for tc in tool_calls:
+                    serialized_calls.append(
+                        {
+                            "id": tc.id,
+                            "type": "function",
+                            "function": {
+                                "name": tc.function.name,
+                                "arguments": tc.function.arguments,
+                            },
+                        }
+                    )
+                    tool_names.append(tc.function.name)
+                assistant_msg["tool_calls"] = serialized_calls
 
             self.messages.append(assistant_msg)
 
             self._log(
                 "model_reply",
                 step=step,
-                content_preview=(msg.content or "")[:200],
-                tools_requested=[tc.function.name for tc in (msg.tool_calls or [])],
+                content_preview=content[:200],
+                tools_requested=tool_names,
             )
 
             # If there are no tool calls, we treat this as the final answer.
-            if not msg.tool_calls:
-                final_text = msg.content or ""
+            if not tool_calls:
                 self._log("run_complete", step=step, outcome="no_tool_calls")
-                return final_text
+                self._flush_log()
+                return content
 
-            # Otherwise, run each tool and feed back results.
-            for tc in msg.tool_calls:
-                result_str = self._run_tool_call(tc)
+            # Otherwise, run the tools (concurrently if the model asked for
+            # several) and feed back results in call order.
+            if len(tool_calls) == 1:
+                results = [self._run_tool_call(tool_calls[0])]
+            else:
+                results = list(_TOOL_EXECUTOR.map(self._run_tool_call, tool_calls))
 
+            for tc, result_str in zip(tool_calls, results):
                 self.messages.append(
                     {
                         "role": "tool",
@@ -185,6 +228,7 @@ class GeosAgent:
 
         # If we hit max_steps without a natural stopping point, return last content.
         self._log("max_steps_reached", max_steps=self.config.max_steps)
+        self._flush_log()
         last_assistant = next(
             (m for m in reversed(self.messages) if m["role"] == "assistant"),
             None,
@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 from typing import Any, Dict
 
@@ -35,16 +36,26 @@ class ReadFileTool(Tool):
 
     def __init__(self, workspace_root: Path):
         self.workspace_root = Path(workspace_root).resolve()
+        # Separator-suffixed prefix for the boundary check; built once so
+        # run() does not re-stringify and concatenate per call.
+        self._root_str = str(self.workspace_root)
+        self._root_prefix = self._root_str + os.sep
 
     def run(self, path: str, max_chars: int = 4000) -> Dict[str, Any]:
         abs_path = (self.workspace_root / path).resolve()
-        if not str(abs_path).startswith(str(self.workspace_root)):
+        # Compare against the separator-suffixed root so a sibling like
+        # /workspace-evil does not pass as inside /workspace.
+        abs_str = str(abs_path)
+        if abs_str != self._root_str and not abs_str.startswith(self._root_prefix):
             return {"error": "Attempted to read outside of workspace."}
 
         if not abs_path.exists():
             return {"error": f"File does not exist: {path}"}
         try:
-            text = abs_path.read_text(encoding="utf-8", errors="replace")
+            # Read one char past the limit to detect truncation without
+            # pulling a potentially huge file fully into memory.
+            with abs_path.open(encoding="utf-8", errors="replace") as f:
+                text = f.read(max_chars + 1)
             if len(text) > max_chars:
                 text = text[:max_chars] + "\n...[truncated]..."
             return {"path": path, "content": text}
@@ -83,17 +94,26 @@ class WriteFileTool(Tool):
 
     def __init__(self, workspace_root: Path):
         self.workspace_root = Path(workspace_root).resolve()
+        self._root_str = str(self.workspace_root)
+        self._root_prefix = self._root_str + os.sep
 
     def run(self, path: str, content: str, overwrite: bool = True) -> Dict[str, Any]:
         abs_path = (self.workspace_root / path).resolve()
-        if not str(abs_path).startswith(str(self.workspace_root)):
+        abs_str = str(abs_path)
+        if abs_str != self._root_str and not abs_str.startswith(self._root_prefix):
             return {"error": "Attempted to write outside of workspace."}
 
         abs_path.parent.mkdir(parents=True, exist_ok=True)
-        mode = "w" if overwrite or not abs_path.exists() else "a"
         try:
-            with abs_path.open(mode, encoding="utf-8") as f:
-                f.write(content)
+            # Dispatch directly: whole-file writes go through write_text,
+            # only the append case needs an explicit open mode.
+            if overwrite or not abs_path.exists():
+                mode = "w"
+                abs_path.write_text(content, encoding="utf-8")
+            else:
+                mode = "a"
+                with abs_path.open("a", encoding="utf-8") as f:
+                    f.write(content)
             return {
                 "path": path,
                 "status": "ok",
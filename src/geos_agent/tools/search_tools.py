@@ -6,6 +6,11 @@ from .base import Tool
 # NOTE: currently stubs; to be implemented later.
 
 
+def _normalize_query(query: str) -> str:
+    """Collapse case and whitespace so near-identical queries share a slot."""
+    return " ".join(query.lower().split())
+
+
 class SearchGeosDocsTool(Tool):
     name = "search_geos_docs"
     description = (
@@ -23,13 +28,34 @@ class SearchGeosDocsTool(Tool):
         "required": ["query"],
     }
 
+    def __init__(self):
+        # Keyed by normalized query. Today this just dedups stub responses;
+        # once real RAG lands, the cached entry will also hold the query
+        # embedding and retrieved chunks so near-duplicate queries skip the
+        # embedding + retrieval round trip.
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
     def run(self, query: str) -> Dict[str, Any]:
         # TODO: implement real doc search (e.g., RAG over docs)
-        return {
+        key = _normalize_query(query)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        # Contract for the future implementation: "results" must be emitted
+        # in a deterministic order and byte-stable format. Serving-side
+        # prompt caches key on exact prefix bytes, so a repeated query that
+        # renders identically lets the provider reuse the cached KV state
+        # for those tokens instead of re-prefilling them.
+        result = {
             "query": query,
+            "results": [],
             "warning": "search_geos_docs is not yet implemented. "
             "Please browse docs manually for now.",
         }
+        if len(self._cache) >= 128:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
 
 
 class SearchWebTool(Tool):
@@ -49,9 +75,20 @@ class SearchWebTool(Tool):
         "required": ["query"],
     }
 
+    def __init__(self):
+        self._cache: Dict[str, Dict[str, Any]] = {}
+
     def run(self, query: str) -> Dict[str, Any]:
         # TODO: wire up to a real web search / RAG
-        return {
+        key = _normalize_query(query)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+        result = {
             "query": query,
             "warning": "search_web is not yet implemented in this environment.",
         }
+        if len(self._cache) >= 128:
+            self._cache.clear()
+        self._cache[key] = result
+        return result
@@ -1,14 +1,28 @@
+import asyncio
+import atexit
+import heapq
+import json
 import os
+import select
 import shlex
+import shutil
+import stat
 import subprocess
 import sys
-import tempfile
+import threading
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from geos_agent.tools.base import Tool
 
 
+@lru_cache(maxsize=256)
+def _split_command(command: str) -> tuple:
+    """shlex.split with memoization; agents re-issue identical commands."""
+    return tuple(shlex.split(command))
+
+
 class ListDirTool(Tool):
     name = "list_dir"
     description = (
@@ -25,34 +39,186 @@ class ListDirTool(Tool):
                     "Use '.' for the workspace root."
                 ),
                 "default": ".",
-            }
+            },
+            "max_entries": {
+                "type": "integer",
+                "description": (
+                    "Maximum number of entries to return. Larger directories "
+                    "are truncated and the result is marked 'truncated'."
+                ),
+                "default": 200,
+            },
+            "max_depth": {
+                "type": "integer",
+                "description": (
+                    "Recurse into subdirectories up to this many levels. "
+                    "1 (the default) lists only the directory itself."
+                ),
+                "default": 1,
+            },
         },
         "required": [],
     }
 
     def __init__(self, workspace_root: Path):
         self.workspace_root = Path(workspace_root).resolve()
+        self._root_str = str(self.workspace_root)
+        self._root_prefix = self._root_str + os.sep
+        # path argument -> resolved Path (None if outside the workspace).
+        # Agents rescan the same few directories over and over; this skips
+        # the symlink-resolving walk after the first check.
+        self._resolve_cache: Dict[str, Optional[Path]] = {}
+        # (path, max_entries) -> (directory mtime_ns, result). Only flat
+        # listings are cached: a change inside a subdirectory doesn't bump
+        # the parent's mtime, so recursive results can't be validated this
+        # way.
+        self._result_cache: Dict[Any, Any] = {}
 
-    def run(self, path: str = ".") -> Dict[str, Any]:
-        abs_dir = (self.workspace_root / path).resolve()
-        if not str(abs_dir).startswith(str(self.workspace_root)):
+    def _resolve_checked(self, path: str) -> Optional[Path]:
+        if path in self._resolve_cache:
+            return self._resolve_cache[path]
+        abs_dir: Optional[Path] = (self.workspace_root / path).resolve()
+        abs_str = str(abs_dir)
+        if abs_str != self._root_str and not abs_str.startswith(self._root_prefix):
+            abs_dir = None
+        if len(self._resolve_cache) >= 256:
+            self._resolve_cache.clear()
+        self._resolve_cache[path] = abs_dir
+        return abs_dir
+
+    def run(
+        self, path: str = ".", max_entries: int = 200, max_depth: int = 1
+    ) -> Dict[str, Any]:
+        abs_dir = self._resolve_checked(path)
+        if abs_dir is None:
             return {"error": "Attempted to list outside of workspace."}
 
-        if not abs_dir.exists():
+        # A flat listing is valid as long as the directory's own mtime is
+        # unchanged (adds/removes/renames all bump it), so repeat scans of
+        # an untouched directory can reuse the previous result.
+        cache_key = None
+        mtime_ns = None
+        if max_depth == 1:
+            try:
+                mtime_ns = os.stat(abs_dir).st_mtime_ns
+            except OSError:
+                pass
+            else:
+                cache_key = (path, max_entries)
+                cached = self._result_cache.get(cache_key)
+                if cached is not None and cached[0] == mtime_ns:
+                    return cached[1]
+
+        # scandir reuses the directory-entry metadata from the kernel, so
+        # type and size checks don't pay one stat syscall per entry each.
+        # EAFP: let the scandir itself report missing/non-directory paths
+        # instead of paying two extra stat calls up front.
+        try:
+            with os.scandir(abs_dir) as it:
+                raw = list(it)
+        except FileNotFoundError:
             return {"error": f"Directory does not exist: {path}"}
-        if not abs_dir.is_dir():
+        except NotADirectoryError:
             return {"error": f"Not a directory: {path}"}
 
+        # Only the first max_entries names can appear in the response, so a
+        # huge directory gets a bounded heap selection (O(n log k)) instead
+        # of a full sort (O(n log n)).
+        discovered = len(raw)
+        if discovered > max_entries:
+            batch = heapq.nsmallest(max_entries, raw, key=lambda e: e.name)
+        else:
+            batch = sorted(raw, key=lambda e: e.name)
+
+        all_entries = [(e.name, e) for e in batch]
+
+        # Deeper levels are walked breadth-first, batching one scandir sweep
+        # per level instead of recursing per directory; descent stops as
+        # soon as the entry cap is exceeded. Entries are reported level by
+        # level with sub-paths like 'sub/child.txt'.
+        level = [
+            (e.path, e.name + os.sep)
+            for e in batch
+            if e.is_dir(follow_symlinks=False)
+        ]
+        depth = 1
+        while level and depth < max_depth and discovered <= max_entries:
+            batch = []
+            next_level = []
+            for dir_path, prefix in level:
+                try:
+                    with os.scandir(dir_path) as it:
+                        batch.extend((prefix + e.name, e) for e in it)
+                except OSError:
+                    continue
+            discovered += len(batch)
+            remaining = max_entries - len(all_entries)
+            if len(batch) > remaining:
+                batch = (
+                    heapq.nsmallest(remaining, batch, key=lambda item: item[0])
+                    if remaining > 0
+                    else []
+                )
+            else:
+                batch.sort(key=lambda item: item[0])
+            for rel_name, e in batch:
+                all_entries.append((rel_name, e))
+                if e.is_dir(follow_symlinks=False):
+                    next_level.append((e.path, rel_name + os.sep))
+            level = next_level
+            depth += 1
+
+        # Cap the response so a huge tree doesn't stat thousands of entries
+        # and flood the model context.
         entries = []
-        for entry in sorted(abs_dir.iterdir()):
+        for rel_name, entry in all_entries:
+            # One stat per entry answers both the type and size questions,
+            # instead of separate is_dir()/is_file() probes plus a stat()
+            # for the size.
+            try:
+                st = entry.stat()
+            except OSError:  # e.g. broken symlink
+                entries.append(
+                    {"name": rel_name, "is_dir": False, "size_bytes": None}
+                )
+                continue
+            mode = st.st_mode
             entries.append(
                 {
-                    "name": entry.name,
-                    "is_dir": entry.is_dir(),
-                    "size_bytes": entry.stat().st_size if entry.is_file() else None,
+                    "name": rel_name,
+                    "is_dir": stat.S_ISDIR(mode),
+                    "size_bytes": st.st_size if stat.S_ISREG(mode) else None,
                 }
             )
-        return {"path": path, "entries": entries}
+        result: Dict[str, Any] = {"path": path, "entries": entries}
+        if discovered > max_entries:
+            result["truncated"] = True
+            result["total_entries"] = discovered
+        if cache_key is not None:
+            if len(self._result_cache) >= 128:
+                self._result_cache.clear()
+            self._result_cache[cache_key] = (mtime_ns, result)
+        return result
+
+
+# How much of each output stream tools report back to the model.
+_TAIL_LIMIT = 4000
+
+
+async def _drain_tail(stream: asyncio.StreamReader, limit: int = _TAIL_LIMIT) -> bytearray:
+    """
+    Drain a subprocess stream, keeping only the last `limit` bytes in a
+    bounded buffer. A chatty command can emit gigabytes; this keeps memory
+    flat instead of capturing everything and slicing.
+    """
+    tail = bytearray()
+    while True:
+        chunk = await stream.read(65536)
+        if not chunk:
+            return tail
+        tail += chunk
+        if len(tail) > limit:
+            del tail[: len(tail) - limit]
 
 
 class ShellCommandTool(Tool):
@@ -82,37 +248,199 @@ class ShellCommandTool(Tool):
 
     def __init__(self, workspace_root: Path):
         self.workspace_root = Path(workspace_root).resolve()
+        # bare executable name -> absolute path, so repeated commands skip
+        # the PATH walk on every spawn.
+        self._exe_cache: Dict[str, str] = {}
+
+    # Simple read-only commands answered in-process; anything with flags,
+    # unexpected arity, or an oversized target falls through to a real
+    # subprocess (whose output the tool already tail-bounds).
+    _BUILTINS = frozenset({"pwd", "ls", "cat"})
+    _LS_LIMIT = 10_000
+
+    def _run_builtin(self, command: str, args: list) -> Optional[Dict[str, Any]]:
+        name = os.path.basename(args[0])
+        if name not in self._BUILTINS or any(a.startswith("-") for a in args[1:]):
+            return None
+        try:
+            if name == "pwd" and len(args) == 1:
+                out = str(self.workspace_root) + "\n"
+            elif name == "ls" and len(args) <= 2:
+                target = self.workspace_root / (args[1] if len(args) == 2 else ".")
+                names = []
+                with os.scandir(target) as it:
+                    for e in it:
+                        if e.name.startswith("."):
+                            continue
+                        names.append(e.name)
+                        if len(names) > self._LS_LIMIT:
+                            # Huge directory; let the real ls stream it
+                            # instead of materializing every name here.
+                            return None
+                names.sort()
+                out = "\n".join(names) + ("\n" if names else "")
+            elif name == "cat" and len(args) == 2:
+                # Workspace logs and dumps reach gigabytes; only the
+                # reported tail is ever read into this process.
+                target = self.workspace_root / args[1]
+                st = os.stat(target)
+                if not stat.S_ISREG(st.st_mode):
+                    return None
+                with open(target, "rb") as f:
+                    if st.st_size > _TAIL_LIMIT:
+                        f.seek(st.st_size - _TAIL_LIMIT)
+                    out = f.read(_TAIL_LIMIT).decode("utf-8", errors="replace")
+            else:
+                return None
+        except OSError:
+            # Let the real command produce its own error output.
+            return None
+        return {
+            "command": command,
+            "returncode": 0,
+            "stdout": out[-_TAIL_LIMIT:],
+            "stderr": "",
+        }
 
     def run(self, command: str, timeout_sec: float = 60.0) -> Dict[str, Any]:
         try:
             # Use shlex.split for safer argument parsing
-            args = shlex.split(command)
+            args = list(_split_command(command))
         except ValueError as e:
             return {"error": f"Failed to parse command: {e}"}
 
+        if args:
+            builtin_result = self._run_builtin(command, args)
+            if builtin_result is not None:
+                return builtin_result
+
+        if args and os.sep not in args[0]:
+            # Path-qualified executables are left alone so they still
+            # resolve relative to the workspace cwd.
+            exe = self._exe_cache.get(args[0])
+            if exe is None:
+                exe = shutil.which(args[0]) or args[0]
+                self._exe_cache[args[0]] = exe
+            args[0] = exe
+
+        # One private event loop per call: both pipes and the process exit
+        # are multiplexed on it, replacing the per-stream reader threads.
+        return asyncio.run(self._run_async(command, args, timeout_sec))
+
+    async def _run_async(
+        self, command: str, args: list, timeout_sec: float
+    ) -> Dict[str, Any]:
         try:
-            proc = subprocess.run(
-                args,
+            # Spawn cost note: CPython only takes its posix_spawn fast path
+            # when cwd is unset, and this tool must pin cwd to the workspace
+            # root. The fork here still uses CPython's vfork fast path on
+            # Linux, which avoids duplicating the parent's page tables.
+            proc = await asyncio.create_subprocess_exec(
+                *args,
                 cwd=str(self.workspace_root),
-                capture_output=True,
-                text=True,
-                timeout=timeout_sec,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
-            return {
-                "command": command,
-                "returncode": proc.returncode,
-                "stdout": proc.stdout[-4000:],
-                "stderr": proc.stderr[-4000:],
-            }
-        except subprocess.TimeoutExpired as e:
+        except Exception as e:
+            return {"command": command, "error": f"Failed to run command: {e!r}"}
+
+        # Stream both pipes into bounded tail buffers so output size never
+        # matters; only the kept tail is decoded at the end.
+        out_task = asyncio.ensure_future(_drain_tail(proc.stdout))
+        err_task = asyncio.ensure_future(_drain_tail(proc.stderr))
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=timeout_sec)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
             return {
                 "command": command,
                 "error": f"Command timed out after {timeout_sec} seconds",
-                "stdout": e.stdout[-4000:] if e.stdout else "",
-                "stderr": e.stderr[-4000:] if e.stderr else "",
+                "stdout": (await out_task).decode("utf-8", errors="replace"),
+                "stderr": (await err_task).decode("utf-8", errors="replace"),
             }
-        except Exception as e:
-            return {"command": command, "error": f"Failed to run command: {e!r}"}
+        return {
+            "command": command,
+            "returncode": proc.returncode,
+            "stdout": (await out_task).decode("utf-8", errors="replace"),
+            "stderr": (await err_task).decode("utf-8", errors="replace"),
+        }
+
+
+# Loop run inside the persistent Python worker: one JSON request per line on
+# stdin, one JSON result per line on stdout. Keeping the interpreter alive
+# across snippets avoids paying interpreter startup per run_python_code call.
+_PY_WORKER_SOURCE = r"""
+import contextlib, io, json, os, sys, traceback
+
+# The JSON protocol must not share fd 1 with snippet output: subprocesses a
+# snippet spawns (and C extensions) write straight to fd 1, bypassing
+# redirect_stdout, and any stray bytes there would corrupt the protocol
+# stream. Keep a private dup of the pipe for replies and point fd 1 at
+# /dev/null so fd-level writes go nowhere.
+_resp = os.fdopen(os.dup(1), "w")
+_devnull = os.open(os.devnull, os.O_WRONLY)
+os.dup2(_devnull, 1)
+os.close(_devnull)
+
+# Agents often re-run the same snippet (e.g. a status check) many times;
+# cache the compiled code objects so only the first occurrence pays parsing.
+_code_cache = {}
+
+for line in sys.stdin:
+    req = json.loads(line)
+    out, err = io.StringIO(), io.StringIO()
+    returncode = 0
+    try:
+        source = req["code"]
+        code_obj = _code_cache.get(source)
+        if code_obj is None:
+            if len(_code_cache) >= 128:
+                _code_cache.clear()
+            code_obj = compile(source, "<snippet>", "exec")
+            _code_cache[source] = code_obj
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            exec(code_obj, {"__name__": "__main__"})
+    except SystemExit as e:
+        if isinstance(e.code, int):
+            returncode = e.code
+        elif e.code is not None:
+            err.write(str(e.code) + "\n")
+            returncode = 1
+    except BaseException as e:
+        tb = e.__traceback__
+        if tb is not None:
+            tb = tb.tb_next  # hide the worker's own exec frame
+        traceback.print_exception(type(e), e, tb, file=err)
+        returncode = 1
+    resp = {"returncode": returncode, "stdout": out.getvalue(), "stderr": err.getvalue()}
+    _resp.write(json.dumps(resp) + "\n")
+    _resp.flush()
+"""
+
+
+class _WorkerUnavailable(Exception):
+    """The worker could not be spawned or never received the request, so
+    the snippet definitely did not execute."""
+
+
+# Every persistent worker ever spawned and not yet killed. The atexit hook
+# reaps whatever is still alive so an interrupted agent run doesn't strand
+# orphan interpreters.
+_LIVE_WORKERS: List[subprocess.Popen] = []
+
+
+def _reap_workers() -> None:
+    for worker in _LIVE_WORKERS:
+        if worker.poll() is None:
+            try:
+                worker.kill()
+            except Exception:
+                pass
+    _LIVE_WORKERS.clear()
+
+
+atexit.register(_reap_workers)
 
 
 class PythonExecTool(Tool):
@@ -142,43 +470,128 @@ class PythonExecTool(Tool):
 
     def __init__(self, workspace_root: Path):
         self.workspace_root = Path(workspace_root).resolve()
+        self._worker: Optional[subprocess.Popen] = None
+        # The worker handles one request at a time; serialize access to it.
+        self._worker_lock = threading.Lock()
 
-    def run(self, code: str, timeout_sec: float = 30.0) -> Dict[str, Any]:
-        # Write code to a temporary file in the workspace
-        self.workspace_root.mkdir(parents=True, exist_ok=True)
-        with tempfile.NamedTemporaryFile(
-            dir=self.workspace_root,
-            suffix=".py",
-            delete=False,
-            mode="w",
-            encoding="utf-8",
-        ) as f:
-            f.write(code)
-            tmp_path = f.name
+    # ----- worker management -----
+
+    def _ensure_worker(self) -> subprocess.Popen:
+        if self._worker is None or self._worker.poll() is not None:
+            self._worker = subprocess.Popen(
+                [sys.executable, "-c", _PY_WORKER_SOURCE],
+                cwd=str(self.workspace_root),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+            _LIVE_WORKERS.append(self._worker)
+        return self._worker
+
+    def _kill_worker(self) -> None:
+        if self._worker is not None:
+            try:
+                self._worker.kill()
+            except Exception:
+                pass
+            try:
+                _LIVE_WORKERS.remove(self._worker)
+            except ValueError:
+                pass
+            self._worker = None
+
+    def _request_worker(
+        self, request: Dict[str, Any], timeout_sec: float
+    ) -> Dict[str, Any]:
+        try:
+            worker = self._ensure_worker()
+        except Exception as e:
+            raise _WorkerUnavailable(e)
+        try:
+            worker.stdin.write(json.dumps(request) + "\n")
+            worker.stdin.flush()
+        except OSError as e:
+            # The worker executes nothing until it has read a full request
+            # line, so a failed write means the snippet never ran.
+            raise _WorkerUnavailable(e)
+        ready, _, _ = select.select([worker.stdout], [], [], timeout_sec)
+        if not ready:
+            # A hung snippet takes its worker with it; the next call
+            # spawns a fresh one.
+            self._kill_worker()
+            return {
+                "error": f"Python execution timed out after {timeout_sec} seconds",
+                "stdout": "",
+                "stderr": "",
+            }
+        line = worker.stdout.readline()
+        if not line:
+            raise RuntimeError("Python worker exited unexpectedly")
+        resp = json.loads(line)
+        return {
+            "returncode": resp["returncode"],
+            "stdout": resp["stdout"][-4000:],
+            "stderr": resp["stderr"][-4000:],
+        }
+
+    def _run_in_subprocess(self, code: str, timeout_sec: float) -> Dict[str, Any]:
+        """Fallback: one-shot subprocess fed via stdin, used if the worker
+        is unusable."""
+        # Capture raw bytes and decode only the 4000-byte tail that is
+        # actually reported, rather than paying text-mode decoding for the
+        # full (possibly huge) output streams.
+        def _tail(buf: Optional[bytes]) -> str:
+            return buf[-_TAIL_LIMIT:].decode("utf-8", errors="replace") if buf else ""
 
         try:
             proc = subprocess.run(
-                [sys.executable, tmp_path],
+                [sys.executable, "-"],
+                input=code.encode("utf-8"),
                 cwd=str(self.workspace_root),
                 capture_output=True,
-                text=True,
                 timeout=timeout_sec,
             )
             return {
-                "script_path": os.path.relpath(tmp_path, self.workspace_root),
                 "returncode": proc.returncode,
-                "stdout": proc.stdout[-4000:],
-                "stderr": proc.stderr[-4000:],
+                "stdout": _tail(proc.stdout),
+                "stderr": _tail(proc.stderr),
             }
         except subprocess.TimeoutExpired as e:
             return {
-                "script_path": os.path.relpath(tmp_path, self.workspace_root),
                 "error": f"Python execution timed out after {timeout_sec} seconds",
-                "stdout": e.stdout[-4000:] if e.stdout else "",
-                "stderr": e.stderr[-4000:] if e.stderr else "",
+                "stdout": _tail(e.stdout),
+                "stderr": _tail(e.stderr),
             }
         except Exception as e:
+            return {"error": f"Failed to execute Python code: {e!r}"}
+
+    # ----- public entry point -----
+
+    def run(self, code: str, timeout_sec: float = 30.0) -> Dict[str, Any]:
+        # The snippet travels in-band over the worker pipe (or the fallback
+        # subprocess's stdin); no temp file is staged in the workspace.
+        self.workspace_root.mkdir(parents=True, exist_ok=True)
+        try:
+            with self._worker_lock:
+                return self._request_worker({"code": code}, timeout_sec)
+        except _WorkerUnavailable:
+            # The request never reached a live worker, so nothing executed
+            # and the one-shot fallback is safe.
+            self._kill_worker()
+            return self._run_in_subprocess(code, timeout_sec)
+        except Exception as e:
+            # Past this point the snippet may already have run (e.g. the
+            # worker died mid-execution via os._exit). Re-running it in the
+            # fallback would silently repeat its side effects, so report
+            # the failure instead.
+            self._kill_worker()
             return {
-                "script_path": os.path.relpath(tmp_path, self.workspace_root),
-                "error": f"Failed to execute Python code: {e!r}",
+                "error": (
+                    f"Python worker failed after the snippet was submitted: "
+                    f"{e!r}. The snippet may or may not have executed; "
+                    "not re-running it."
+                ),
+                "stdout": "",
+                "stderr": "",
             }
@@ -1,9 +1,5 @@
 from pathlib import Path
 
-from geos_agent.agent_config import AgentConfig
-from geos_agent.geos_agent import GeosAgent
-from geos_agent.tools.utils import build_default_tools
-
 # ==============================
 # Simple CLI entrypoint
 # ==============================
@@ -18,7 +14,7 @@ def main():
     parser.add_argument(
         "instruction",
         type=str,
-        nargs="+",
+        nargs="*",
         help="High-level natural language instruction for the agent.",
     )
     parser.add_argument(
@@ -45,8 +41,53 @@ def main():
         default=10,
         help="Maximum agent-tool iterations.",
     )
+    parser.add_argument(
+        "--check-imports",
+        action="store_true",
+        help=(
+            "Import each agent module, print per-module status as JSON, "
+            "and exit (non-zero if any import fails)."
+        ),
+    )
 
     args = parser.parse_args()
+
+    if args.check_imports:
+        # Smoke-check the deferred imports without running the agent, so a
+        # broken environment (e.g. missing openai) is diagnosed up front.
+        import importlib
+        import json
+        import sys
+
+        status = {}
+        for mod in (
+            "geos_agent.agent_config",
+            "geos_agent.geos_agent",
+            "geos_agent.tools.base",
+            "geos_agent.tools.file_tools",
+            "geos_agent.tools.geos_tool",
+            "geos_agent.tools.search_tools",
+            "geos_agent.tools.shell_tools",
+            "geos_agent.tools.utils",
+        ):
+            try:
+                importlib.import_module(mod)
+                status[mod] = "ok"
+            except Exception as e:
+                status[mod] = f"error: {e!r}"
+        print(json.dumps(status, indent=2))
+        sys.exit(0 if all(s == "ok" for s in status.values()) else 1)
+
+    if not args.instruction:
+        parser.error("instruction is required unless --check-imports is given")
+
+    # Import the agent stack only after arguments parse: the OpenAI client
+    # import dominates cold start, and --help / bad-args invocations (plus
+    # any subprocess that re-imports this module) shouldn't pay for it.
+    from geos_agent.agent_config import AgentConfig
+    from geos_agent.geos_agent import GeosAgent
+    from geos_agent.tools.utils import build_default_tools
+
     workspace_root = Path(args.workspace).resolve()
     log_path = Path(args.log) if args.log else None
 
@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple, Type
 
 from .base import Tool
 from .file_tools import ReadFileTool, WriteFileTool
@@ -7,15 +7,31 @@ from .geos_tool import RunGeosTool
 from .search_tools import SearchGeosDocsTool, SearchWebTool
 from .shell_tools import ListDirTool, PythonExecTool, ShellCommandTool
 
+# Registry of the default tool classes, in spec order. The bool marks tools
+# that are scoped to a workspace root.
+DEFAULT_TOOLS: List[Tuple[Type[Tool], bool]] = [
+    (ReadFileTool, True),
+    (WriteFileTool, True),
+    (ListDirTool, True),
+    (ShellCommandTool, True),
+    (PythonExecTool, True),
+    (SearchGeosDocsTool, False),
+    (SearchWebTool, False),
+    (RunGeosTool, True),
+]
+
+# One built tool list per workspace root. Several tools now carry warm state
+# (resolve caches, the Python worker), so rebuilding them per call would
+# throw that away.
+_TOOLS_BY_ROOT: Dict[Path, List[Tool]] = {}
+
 
 def build_default_tools(workspace_root: Path) -> List[Tool]:
-    return [
-        ReadFileTool(workspace_root),
-        WriteFileTool(workspace_root),
-        ListDirTool(workspace_root),
-        ShellCommandTool(workspace_root),
-        PythonExecTool(workspace_root),
-        SearchGeosDocsTool(),
-        SearchWebTool(),
-        RunGeosTool(workspace_root),
-    ]
+    root = Path(workspace_root).resolve()
+    tools = _TOOLS_BY_ROOT.get(root)
+    if tools is None:
+        tools = [
+            cls(root) if needs_root else cls() for cls, needs_root in DEFAULT_TOOLS
+        ]
+        _TOOLS_BY_ROOT[root] = tools
+    return tools